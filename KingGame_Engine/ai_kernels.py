@@ -0,0 +1,227 @@
+"""
+AI Kernels
+==========
+
+Integer-only decision routines for the heuristic AI player.
+
+Cards are encoded as one byte each: the rank value (2-14) in bits 0-3 and
+the suit value (0-3) in bits 4-5. Strategies take the encoded valid plays plus a
+few integers describing the current vaza and return the index of the card
+to play, so the per-decision path never touches Card or Enum attributes.
+"""
+
+from functools import lru_cache, partial
+from typing import Callable
+
+from deck import Card, Suit, Rank
+
+# Round type codes
+ROUND_VAZAS = 0
+ROUND_COPAS = 1
+ROUND_HOMENS = 2
+ROUND_MULHERES = 3
+ROUND_KING = 4
+ROUND_LAST = 5
+ROUND_OTHER = -1
+
+ROUND_CODES: dict[str, int] = {
+    "vazas": ROUND_VAZAS,
+    "copas": ROUND_COPAS,
+    "homens": ROUND_HOMENS,
+    "mulheres": ROUND_MULHERES,
+    "king": ROUND_KING,
+    "last": ROUND_LAST,
+}
+
+# Card encoding
+RANK_MASK = 0x0F
+SUIT_SHIFT = 4
+HEARTS_CODE = Suit.HEARTS.value
+KING_OF_HEARTS_CODE = Rank.KING.value | (HEARTS_CODE << SUIT_SHIFT)
+
+# Encoded cards that cost points when taken, per avoidance round
+NO_PENALTY: frozenset[int] = frozenset()
+PENALTY_CODES: dict[int, frozenset[int]] = {
+    ROUND_COPAS: frozenset(r.value | (HEARTS_CODE << SUIT_SHIFT) for r in Rank),
+    ROUND_HOMENS: frozenset(
+        r.value | (suit.value << SUIT_SHIFT)
+        for r in (Rank.JACK, Rank.KING) for suit in Suit
+    ),
+    ROUND_MULHERES: frozenset(
+        Rank.QUEEN.value | (suit.value << SUIT_SHIFT) for suit in Suit
+    ),
+}
+
+
+def encode_cards(cards: list[Card]) -> bytes:
+    """
+    Encode cards as one byte each (rank in the low nibble, suit above it).
+    
+    Parameters
+    ----------
+    cards : list[Card]
+        Cards to encode.
+    
+    Returns
+    -------
+    bytes
+        Encoded cards, in the same order as the input list.
+    """
+    return bytes([c.rv | (c.sv << SUIT_SHIFT) for c in cards])
+
+
+def lowest_index(codes: bytes, indices) -> int:
+    """Return the index (first on ties) of the lowest-ranked code among indices."""
+    best_i = -1
+    best_r = RANK_MASK + 1
+    for i in indices:
+        r = codes[i] & RANK_MASK
+        if r < best_r:
+            best_i, best_r = i, r
+    return best_i
+
+
+def choose_lowest(codes: bytes, played_count: int, main_code: int, highest_main: int) -> int:
+    """
+    Fallback strategy for unknown round types: play the lowest card.
+    
+    Parameters
+    ----------
+    codes : bytes
+        Encoded cards that can be legally played.
+    played_count : int
+        Number of cards already played in the current vaza (unused).
+    main_code : int
+        Suit code of the main suit (unused).
+    highest_main : int
+        Highest main-suit rank played so far (unused).
+    
+    Returns
+    -------
+    int
+        Index of the lowest card.
+    """
+    return lowest_index(codes, range(len(codes)))
+
+
+def choose_avoid(codes: bytes, played_count: int, main_code: int, highest_main: int,
+                 penalty_codes: frozenset[int], skip: int = -1) -> int:
+    """
+    Generic strategy for avoidance rounds: don't win tricks holding penalty cards.
+    
+    Parameters
+    ----------
+    codes : bytes
+        Encoded cards that can be legally played.
+    played_count : int
+        Number of cards already played in the current vaza.
+    main_code : int
+        Suit code of the main suit (ignored when played_count is 0).
+    highest_main : int
+        Highest main-suit rank played so far (ignored when played_count is 0).
+    penalty_codes : frozenset[int]
+        Encoded cards that cost points when taken (empty for vazas/last).
+    skip : int, optional
+        Index of a card that must not be chosen, or -1 for none (default is -1).
+    
+    Returns
+    -------
+    int
+        Index of the card to play.
+    
+    Notes
+    -----
+    - First to play: lowest non-penalty card, or lowest card if all are penalty cards
+    - Otherwise: highest penalty card that won't win, then highest card that won't win
+    - If every card would win: highest card when last to play (the vaza is
+      lost anyway), otherwise lowest card
+    
+    All candidates are reduced in a single pass without building any
+    intermediate lists.
+    """
+    lowest_i = lowest_clean_i = highest_i = best_safe_i = best_penalty_i = -1
+    lowest_r = lowest_clean_r = RANK_MASK + 1
+    highest_r = best_safe_r = best_penalty_r = -1
+    for i, code in enumerate(codes):
+        if i == skip:
+            continue
+        r = code & RANK_MASK
+        is_penalty = code in penalty_codes
+        if r < lowest_r:
+            lowest_i, lowest_r = i, r
+        if not is_penalty and r < lowest_clean_r:
+            lowest_clean_i, lowest_clean_r = i, r
+        if r > highest_r:
+            highest_i, highest_r = i, r
+        if code >> SUIT_SHIFT != main_code or r < highest_main:
+            if r > best_safe_r:
+                best_safe_i, best_safe_r = i, r
+            if is_penalty and r > best_penalty_r:
+                best_penalty_i, best_penalty_r = i, r
+    
+    if played_count == 0:
+        # First to play: prefer non-penalty cards, play lowest
+        return lowest_clean_i if lowest_clean_i >= 0 else lowest_i
+    
+    # Prioritize penalty cards among safe cards, then any safe card
+    if best_penalty_i >= 0:
+        return best_penalty_i
+    if best_safe_i >= 0:
+        return best_safe_i
+    
+    # All cards would win - if last player, dump highest; otherwise play lowest
+    is_last_player = played_count == 3
+    return highest_i if is_last_player else lowest_i
+
+
+def choose_king(codes: bytes, played_count: int, main_code: int, highest_main: int) -> int:
+    """
+    Strategy for king round: Avoid taking King of Hearts.
+    
+    Parameters
+    ----------
+    codes : bytes
+        Encoded cards that can be legally played.
+    played_count : int
+        Number of cards already played in the current vaza.
+    main_code : int
+        Suit code of the main suit (ignored when played_count is 0).
+    highest_main : int
+        Highest main-suit rank played so far (ignored when played_count is 0).
+    
+    Returns
+    -------
+    int
+        Index of the card to play. Tries to avoid winning tricks to avoid
+        taking King of Hearts. Plays highest card that won't win if possible.
+    
+    Notes
+    -----
+    The penalty is for taking the trick containing King of Hearts,
+    so we try to avoid winning any trick (unless KH is already taken).
+    If the King of Hearts is held alongside other cards it is never chosen.
+    """
+    # Callers pass at least two codes, so skipping KH always leaves another card
+    return choose_avoid(codes, played_count, main_code, highest_main, NO_PENALTY,
+                        skip=codes.find(KING_OF_HEARTS_CODE))
+
+
+# Strategy per round code, the source of CACHED_STRATEGIES below; unknown
+# rounds fall back to choose_lowest
+STRATEGIES: dict[int, Callable[[bytes, int, int, int], int]] = {
+    ROUND_VAZAS: partial(choose_avoid, penalty_codes=NO_PENALTY),
+    ROUND_COPAS: partial(choose_avoid, penalty_codes=PENALTY_CODES[ROUND_COPAS]),
+    ROUND_HOMENS: partial(choose_avoid, penalty_codes=PENALTY_CODES[ROUND_HOMENS]),
+    ROUND_MULHERES: partial(choose_avoid, penalty_codes=PENALTY_CODES[ROUND_MULHERES]),
+    ROUND_KING: choose_king,
+    ROUND_LAST: partial(choose_avoid, penalty_codes=NO_PENALTY),
+}
+
+# Strategies are pure functions of their integer arguments, so identical
+# decisions (common across Monte Carlo simulations) are answered from a
+# cache. The key keeps the card order since ties go to the first card.
+STRATEGY_CACHE_SIZE = 4096
+CACHED_STRATEGIES: dict[int, Callable[[bytes, int, int, int], int]] = {
+    round_code: lru_cache(maxsize=STRATEGY_CACHE_SIZE)(strategy)
+    for round_code, strategy in STRATEGIES.items()
+}
@@ -1,29 +1,34 @@
 import random
-from enum import Enum
+from enum import IntEnum
+from operator import attrgetter
 
 
-class Suit(Enum):
+class Suit(IntEnum):
     """
     Enumeration of the four card suits in a standard deck.
     
     Attributes
     ----------
-    HEARTS : str
+    HEARTS : int
         Hearts suit.
-    DIAMONDS : str
+    DIAMONDS : int
         Diamonds suit.
-    CLUBS : str
+    CLUBS : int
         Clubs suit.
-    SPADES : str
+    SPADES : int
         Spades suit.
+    
+    Notes
+    -----
+    Members are ints so that suit comparisons are plain integer compares.
     """
-    HEARTS = "Hearts"
-    DIAMONDS = "Diamonds"
-    CLUBS = "Clubs"
-    SPADES = "Spades"
+    HEARTS = 0
+    DIAMONDS = 1
+    CLUBS = 2
+    SPADES = 3
 
 
-class Rank(Enum):
+class Rank(IntEnum):
     """
     Enumeration of the thirteen card ranks in a standard deck.
     
@@ -48,6 +53,12 @@ class Rank(Enum):
     ACE = 14
 
 
+# Lookup maps for Card.from_string
+_SUIT_MAP: dict[str, Suit] = {'H': Suit.HEARTS, 'D': Suit.DIAMONDS, 'C': Suit.CLUBS, 'S': Suit.SPADES}
+_LETTER_MAP: dict[str, Rank] = {'A': Rank.ACE, 'K': Rank.KING, 'Q': Rank.QUEEN, 'J': Rank.JACK}
+_RANK_BY_VALUE: dict[int, Rank] = {r.value: r for r in Rank}
+
+
 class Card:
     """
     Represents a single playing card.
@@ -61,6 +72,15 @@ class Card:
         The suit of the card (Hearts, Diamonds, Clubs, or Spades).
     rank : Rank
         The rank of the card (2-10, Jack, Queen, King, or Ace).
+    rv : int
+        Cached rank value (2-14), equal to rank.value.
+    sv : int
+        Cached suit index (0-3), equal to suit.value.
+    idx : int
+        Position of the card (0-51) in the unshuffled deck, used to index
+        the per-card lookup tables.
+    bit : int
+        1 << idx, the card's bit in 52-bit card-set masks.
     
     Methods
     -------
@@ -72,9 +92,12 @@ class Card:
         Return hash value for use in sets and dictionaries.
     """
     
-    def __init__(self, suit: Suit, rank: Rank) -> None:
+    # One shared instance per (suit, rank), filled as cards are first created
+    _INSTANCES: dict[tuple[Suit, Rank], "Card"] = {}
+    
+    def __new__(cls, suit: Suit, rank: Rank) -> "Card":
         """
-        Initialize a card with a suit and rank.
+        Return the card with a suit and rank.
         
         Parameters
         ----------
@@ -82,12 +105,39 @@ class Card:
             The suit of the card.
         rank : Rank
             The rank of the card.
+        
+        Returns
+        -------
+        Card
+            The single shared instance for this suit and rank.
+        
+        Notes
+        -----
+        Cards are interned like small ints: every Card(suit, rank) call
+        returns the same object, so equality and membership checks are
+        settled by the identity fast path.
         """
-        self.suit = suit
-        self.rank = rank
+        card = cls._INSTANCES.get((suit, rank))
+        if card is None:
+            card = super().__new__(cls)
+            card.suit = suit
+            card.rank = rank
+            # Plain ints for hot comparisons, avoiding Enum attribute access
+            card.rv = rank.value
+            card.sv = suit.value
+            card.idx = card.sv * 13 + card.rv - 2
+            card.bit = 1 << card.idx
+            # Cards never change, so format the display string once
+            card._str = f"{rank.value}{suit.name[0]}"
+            cls._INSTANCES[(suit, rank)] = card
+        return card
+    
+    def __reduce__(self) -> tuple:
+        # Copies and unpickled cards resolve back to the shared instance
+        return Card, (self.suit, self.rank)
     
     def __repr__(self) -> str:
-        return f"{self.rank.value}{self.suit.name[0]}"
+        return self._str
     
     def __eq__(self, other: "Card") -> bool:
         """
@@ -106,9 +156,11 @@ class Card:
         bool
             True if other is a Card with the same suit and rank, False otherwise.
         """
+        if self is other:
+            return True
         if not isinstance(other, Card):
             return False
-        return self.suit == other.suit and self.rank == other.rank
+        return self.idx == other.idx
     
     def __hash__(self) -> int:
         """
@@ -126,9 +178,11 @@ class Card:
         Notes
         -----
         Required when implementing __eq__ to maintain the invariant that
-        objects that compare equal must have the same hash value.
+        objects that compare equal must have the same hash value. The
+        card index already identifies suit and rank, so it is used as the
+        hash directly instead of hashing a (suit, rank) tuple.
         """
-        return hash((self.suit, self.rank))
+        return self.idx
     
     @staticmethod
     def from_string(card_str: str) -> "Card | None":
@@ -166,29 +220,42 @@ class Card:
         rank_str = card_str[:-1]
         
         # Parse suit
-        suit_map = {'H': Suit.HEARTS, 'D': Suit.DIAMONDS, 'C': Suit.CLUBS, 'S': Suit.SPADES}
-        if suit_char not in suit_map:
+        suit = _SUIT_MAP.get(suit_char)
+        if suit is None:
             return None
-        suit = suit_map[suit_char]
         
         # Parse rank
-        rank: Rank | None = None
+        rank: Rank | None
         if rank_str.isdigit():
-            rank_value = int(rank_str)
-            for r in Rank:
-                if r.value == rank_value:
-                    rank = r
-                    break
+            rank = _RANK_BY_VALUE.get(int(rank_str))
         else:
             # Letter format
-            letter_map = {'A': Rank.ACE, 'K': Rank.KING, 'Q': Rank.QUEEN, 'J': Rank.JACK}
-            rank = letter_map.get(rank_str)
+            rank = _LETTER_MAP.get(rank_str)
         
         if rank is None:
             return None
         
         return Card(suit, rank)
 
+
+# The 52 cards never change, so build them once and copy per deck
+_ALL_CARDS: tuple[Card, ...] = tuple(Card(suit, rank) for suit in Suit for rank in Rank)
+
+# Cards are interned, so membership tests against this hit the identity fast path
+KING_OF_HEARTS: Card = Card(Suit.HEARTS, Rank.KING)
+
+# Sort key ordering cards by suit, then rank; Card.idx encodes exactly that
+CARD_SORT_KEY = attrgetter("idx")
+
+# Per-card lookup tables indexed by Card.idx, replacing suit/rank compares
+IS_HEART: tuple[bool, ...] = tuple(c.suit == Suit.HEARTS for c in _ALL_CARDS)
+IS_MAN: tuple[bool, ...] = tuple(c.rank in (Rank.JACK, Rank.KING) for c in _ALL_CARDS)
+IS_QUEEN: tuple[bool, ...] = tuple(c.rank == Rank.QUEEN for c in _ALL_CARDS)
+IS_KING_OF_HEARTS: tuple[bool, ...] = tuple(
+    c.suit == Suit.HEARTS and c.rank == Rank.KING for c in _ALL_CARDS
+)
+
+
 class Deck:
     """
     A standard 52-card deck for card games.
@@ -242,26 +309,23 @@ class Deck:
         -----
         This is a static method that creates cards without requiring a Deck instance.
         Useful for getting all possible cards for analysis or comparison.
+        The returned list is a fresh copy of the module-level card tuple.
         """
-        cards = []
-        for suit in Suit:
-            for rank in Rank:
-                cards.append(Card(suit, rank))
-        return cards
+        return list(_ALL_CARDS)
     
     def _create_deck(self) -> None:
         """
         Create all 52 cards and shuffle the deck.
         
-        This private method generates one card for each combination of
-        suit and rank, then shuffles the entire deck randomly.
+        This private method copies the precomputed 52 cards (one for each
+        combination of suit and rank), then shuffles the entire deck randomly.
         
         Notes
         -----
         This method clears any existing cards and creates a fresh deck
         of 52 cards (4 suits × 13 ranks).
         """
-        self.cards = Deck.get_all_cards()
+        self.cards = list(_ALL_CARDS)
         random.shuffle(self.cards)
     
     def reset(self) -> None:
@@ -304,10 +368,8 @@ class Deck:
         hands: list[list[Card]] = [[] for _ in range(num_players)]
         
         if distribute_remainder:
-            # Distribute all cards in round-robin fashion
-            for i, card in enumerate(self.cards):
-                player_index = i % num_players
-                hands[player_index].append(card)
+            # Round-robin: card i goes to player i % num_players, i.e. a stride slice
+            hands = [self.cards[p::num_players] for p in range(num_players)]
         else:
             # Only distribute cards that divide evenly
             cards_per_player = len(self.cards) // num_players
@@ -5,10 +5,69 @@ Game Display Module
 Handles all console output and user interface for the King card game.
 """
 
-from deck import Card, Suit, Rank
+import sys
+from types import MappingProxyType
+from typing import Callable
+
+from deck import Card, CARD_SORT_KEY
 from game_simulator import Round
 from game_player import GamePlayer
 
+_DIVIDER = "=" * 80
+
+# Constant text blocks, rendered once at import
+_SETUP_HEADER = "\n".join([
+    _DIVIDER,
+    "SETUP: Player Configuration",
+    _DIVIDER,
+    "Configure each player's name and type:",
+    "  - HUMAN players: You input which card they played",
+    "  - AI players: Computer decides and shows the card\n",
+])
+_GAME_HEADER_PREFIX = "\n".join([
+    "\n" + _DIVIDER,
+    "REAL-LIFE KING GAME ASSISTANT",
+    _DIVIDER,
+    "Instructions:",
+    "  1. Shuffle and deal 13 cards to each player in real life",
+    "  2. The program will track plays and calculate scores",
+    "  3. For human players, input which card they played",
+    "  4. For AI players, the computer will show which card to play",
+    "  5. Type 'help' at any time for card format examples",
+    _DIVIDER,
+])
+_CARD_HELP = "\n".join([
+    "\n  Card format examples:",
+    "    - Number + Suit: 2H, 10D, 13C, 14S",
+    "    - Letter + Suit: AH (Ace), KS (King), QD (Queen), JC (Jack)",
+    "    - Suits: H=Hearts, D=Diamonds, C=Clubs, S=Spades",
+    "    - Examples: 'AH' = Ace of Hearts, 'KH' = King of Hearts",
+    "                '7D' = 7 of Diamonds, '10S' = 10 of Spades\n",
+])
+# Medal per final position (index 0 unused)
+_MEDALS = ("  ", "🥇", "🥈", "🥉")
+_FINAL_STANDINGS_HEADER = f"\n{_DIVIDER}\nSEASON OVER!\n{_DIVIDER}\n\nFINAL STANDINGS:\n"
+
+# Objective shown in each round header (read-only)
+_ROUND_DESCRIPTIONS: MappingProxyType[str, str] = MappingProxyType({
+    "vazas": "Avoid winning vazas",
+    "copas": "Avoid collecting Hearts (♥)",
+    "homens": "Avoid collecting Jacks and Kings",
+    "mulheres": "Avoid collecting Queens",
+    "king": "Avoid the King of Hearts (K♥)",
+    "last": "Avoid winning the last vaza"
+})
+
+# Round detail formatter per round type: (round, player_idx) -> str
+_DETAIL_HANDLERS: dict[str, Callable[[Round, int], str]] = {
+    "vazas": lambda r, i: f"{r.vazas_won[i]} vazas",
+    "copas": lambda r, i: f"{r.penalty_won[i]} hearts",
+    "homens": lambda r, i: f"{r.penalty_won[i]} men (J+K)",
+    "mulheres": lambda r, i: f"{r.penalty_won[i]} queens",
+    "king": lambda r, i: "King of Hearts!" if r.penalty_won[i] else "Safe",
+    "last": lambda r, i: "Won last vaza!" if r.vazas_won[i] > 0 else "Safe",
+}
+
 
 class GameDisplay:
     """
@@ -19,7 +78,38 @@ class GameDisplay:
     UI implementation.
     """
     
-    DIVIDER = "=" * 80
+    DIVIDER = _DIVIDER
+    
+    # Lines queued by _print and written to stdout in one call by flush
+    _pending: list[str] = []
+    
+    @staticmethod
+    def _print(line: str = "") -> None:
+        """
+        Queue a line for output, in place of print().
+        
+        Parameters
+        ----------
+        line : str, optional
+            Line to queue; a newline is added when written (default is "").
+        """
+        GameDisplay._pending.append(line)
+    
+    @staticmethod
+    def flush() -> None:
+        """
+        Write all queued lines to stdout with a single write call.
+        
+        Notes
+        -----
+        Every show_* method flushes at the end of its block, so output is
+        never held back past an input() prompt, but a block costs one write
+        instead of one (or, on a TTY, two) per line.
+        """
+        if GameDisplay._pending:
+            sys.stdout.write("\n".join(GameDisplay._pending) + "\n")
+            GameDisplay._pending.clear()
+        sys.stdout.flush()
     
     @staticmethod
     def display_card_list(cards: list[Card], sort: bool = True) -> str:
@@ -39,18 +129,15 @@ class GameDisplay:
             Comma-separated string representation of cards.
         """
         if sort:
-            cards = sorted(cards, key=lambda c: (c.suit.value, c.rank.value))
-        return ", ".join([str(card) for card in cards])
+            cards = sorted(cards, key=CARD_SORT_KEY)
+        # Each interned card caches its display string, returned by __repr__
+        return ", ".join(map(str, cards))
     
     @staticmethod
     def show_setup_header():
         """Display the player setup header."""
-        print(GameDisplay.DIVIDER)
-        print("SETUP: Player Configuration")
-        print(GameDisplay.DIVIDER)
-        print("Configure each player's name and type:")
-        print("  - HUMAN players: You input which card they played")
-        print("  - AI players: Computer decides and shows the card\n")
+        GameDisplay._print(_SETUP_HEADER)
+        GameDisplay.flush()
     
     @staticmethod
     def show_game_header(player_names: list[str], player_is_ai: list[bool]):
@@ -64,18 +151,9 @@ class GameDisplay:
         player_is_ai : list[bool]
             Flags indicating if each player is AI.
         """
-        print("\n" + GameDisplay.DIVIDER)
-        print("REAL-LIFE KING GAME ASSISTANT")
-        print(GameDisplay.DIVIDER)
-        print("Instructions:")
-        print("  1. Shuffle and deal 13 cards to each player in real life")
-        print("  2. The program will track plays and calculate scores")
-        print("  3. For human players, input which card they played")
-        print("  4. For AI players, the computer will show which card to play")
-        print("  5. Type 'help' at any time for card format examples")
-        print(GameDisplay.DIVIDER)
         player_types = ', '.join([f'{player_names[i]} ({"AI" if player_is_ai[i] else "HUMAN"})' for i in range(4)])
-        print(f"\nPlayers: {player_types}\n")
+        GameDisplay._print(f"{_GAME_HEADER_PREFIX}\n\nPlayers: {player_types}\n")
+        GameDisplay.flush()
     
     @staticmethod
     def show_round_header(round_type: str, description: str):
@@ -89,10 +167,9 @@ class GameDisplay:
         description : str
             Description of the round objective.
         """
-        print("\n" + GameDisplay.DIVIDER)
-        print(f"ROUND: {round_type.upper()}")
-        print(GameDisplay.DIVIDER)
-        print(f"Objective: {description}\n")
+        divider = GameDisplay.DIVIDER
+        GameDisplay._print(f"\n{divider}\nROUND: {round_type.upper()}\n{divider}\nObjective: {description}\n")
+        GameDisplay.flush()
     
     @staticmethod
     def show_vaza_header(vaza_num: int, starter: GamePlayer, play_order: list[GamePlayer], 
@@ -111,15 +188,17 @@ class GameDisplay:
         cards_played_count : int
             Number of cards already played in the round.
         """
-        print(GameDisplay.DIVIDER)
-        print(f"VAZA {vaza_num}")
-        print(GameDisplay.DIVIDER)
-        print(f"Starter: {starter.name}")
-        print(f"Play order: {', '.join([p.name for p in play_order])}\n")
-        
-        if cards_played_count > 0:
-            print(f"Cards played in previous vazas: {cards_played_count} cards")
-        print()
+        divider = GameDisplay.DIVIDER
+        extra = f"Cards played in previous vazas: {cards_played_count} cards\n" if cards_played_count > 0 else ""
+        GameDisplay._print(
+            f"{divider}\n"
+            f"VAZA {vaza_num}\n"
+            f"{divider}\n"
+            f"Starter: {starter.name}\n"
+            f"Play order: {', '.join([p.name for p in play_order])}\n\n"
+            f"{extra}"
+        )
+        GameDisplay.flush()
     
     @staticmethod
     def show_ai_play(player: GamePlayer, card: Card):
@@ -133,7 +212,8 @@ class GameDisplay:
         card : Card
             Card played by AI.
         """
-        print(f">>> {player.name} (AI) plays: {card}")
+        GameDisplay._print(f">>> {player.name} (AI) plays: {card}")
+        GameDisplay.flush()
     
     @staticmethod
     def show_ai_no_valid_plays(player: GamePlayer, hand: list[Card]):
@@ -147,8 +227,9 @@ class GameDisplay:
         hand : list[Card]
             Player's current hand.
         """
-        print(f"⚠️  WARNING: {player.name} (AI) has no valid plays!")
-        print(f"   Hand: {GameDisplay.display_card_list(hand)}")
+        GameDisplay._print(f"⚠️  WARNING: {player.name} (AI) has no valid plays!")
+        GameDisplay._print(f"   Hand: {GameDisplay.display_card_list(hand)}")
+        GameDisplay.flush()
     
     @staticmethod
     def show_human_turn(player: GamePlayer, cards_played: list[Card]):
@@ -162,25 +243,23 @@ class GameDisplay:
         cards_played : list[Card]
             Cards already played in this vaza.
         """
-        print(f"{player.name}'s turn:")
+        GameDisplay._print(f"{player.name}'s turn:")
         
         if cards_played:
-            print(f"  Cards played this vaza: {GameDisplay.display_card_list(cards_played, sort=False)}")
+            GameDisplay._print(f"  Cards played this vaza: {GameDisplay.display_card_list(cards_played, sort=False)}")
+        GameDisplay.flush()
     
     @staticmethod
     def show_card_help():
         """Display card format help."""
-        print("\n  Card format examples:")
-        print("    - Number + Suit: 2H, 10D, 13C, 14S")
-        print("    - Letter + Suit: AH (Ace), KS (King), QD (Queen), JC (Jack)")
-        print("    - Suits: H=Hearts, D=Diamonds, C=Clubs, S=Spades")
-        print("    - Examples: 'AH' = Ace of Hearts, 'KH' = King of Hearts")
-        print("                '7D' = 7 of Diamonds, '10S' = 10 of Spades\n")
+        GameDisplay._print(_CARD_HELP)
+        GameDisplay.flush()
     
     @staticmethod
     def show_invalid_card_format():
         """Display invalid card format message."""
-        print(f"  ❌ Invalid card format. Try again (or type 'help')\n")
+        GameDisplay._print(f"  ❌ Invalid card format. Try again (or type 'help')\n")
+        GameDisplay.flush()
     
     @staticmethod
     def show_card_already_played(card: Card):
@@ -192,7 +271,8 @@ class GameDisplay:
         card : Card
             Card that was already played.
         """
-        print(f"  ❌ {card} was already played earlier.")
+        GameDisplay._print(f"  ❌ {card} was already played earlier.")
+        GameDisplay.flush()
     
     @staticmethod
     def show_card_played(player: GamePlayer, card: Card):
@@ -206,7 +286,8 @@ class GameDisplay:
         card : Card
             Card that was played.
         """
-        print(f"  ✓ {player.name} plays: {card}\n")
+        GameDisplay._print(f"  ✓ {player.name} plays: {card}\n")
+        GameDisplay.flush()
     
     @staticmethod
     def show_vaza_winner(winner: GamePlayer, vazas_won: list[int], players: list[GamePlayer]):
@@ -222,8 +303,9 @@ class GameDisplay:
         players : list[GamePlayer]
             List of all players.
         """
-        print(f"🏆 Vaza won by: {winner.name}")
-        print(f"Vazas won so far: {', '.join([f'{players[i].name}: {vazas_won[i]}' for i in range(4)])}\n")
+        GameDisplay._print(f"🏆 Vaza won by: {winner.name}")
+        GameDisplay._print(f"Vazas won so far: {', '.join([f'{players[i].name}: {vazas_won[i]}' for i in range(4)])}\n")
+        GameDisplay.flush()
     
     @staticmethod
     def show_round_results(round_type: str, players: list[GamePlayer], points: list[int],
@@ -244,14 +326,14 @@ class GameDisplay:
         cumulative_points : list[int]
             Cumulative points for all players.
         """
-        print("\n" + GameDisplay.DIVIDER)
-        print(f"ROUND {round_type.upper()} - RESULTS")
-        print(GameDisplay.DIVIDER)
+        divider = GameDisplay.DIVIDER
+        GameDisplay._print(f"\n{divider}\nROUND {round_type.upper()} - RESULTS\n{divider}")
         
         for i, player in enumerate(players):
-            print(f"{player.name:20} - {details[i]:30} Points: {points[i]:+5d}")
+            GameDisplay._print(f"{player.name:20} - {details[i]:30} Points: {points[i]:+5d}")
         
-        print(f"\nCumulative points: {', '.join([f'{players[i].name}: {cumulative_points[i]}' for i in range(4)])}")
+        GameDisplay._print(f"\nCumulative points: {', '.join([f'{players[i].name}: {cumulative_points[i]}' for i in range(4)])}")
+        GameDisplay.flush()
     
     @staticmethod
     def show_final_standings(player_names: list[str], cumulative_points: list[int]):
@@ -265,22 +347,17 @@ class GameDisplay:
         cumulative_points : list[int]
             Final cumulative points.
         """
-        print("\n" + GameDisplay.DIVIDER)
-        print("SEASON OVER!")
-        print(GameDisplay.DIVIDER)
-        print("\nFINAL STANDINGS:\n")
+        GameDisplay._print(_FINAL_STANDINGS_HEADER)
         
-        sorted_players = sorted(
-            zip(player_names, cumulative_points),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        # Sort player indices by points (stable, so ties keep seating order)
+        order = sorted(range(len(cumulative_points)), key=cumulative_points.__getitem__, reverse=True)
         
-        for i, (player, points) in enumerate(sorted_players, 1):
-            medal = {1: "🥇", 2: "🥈", 3: "🥉"}.get(i, "  ")
-            print(f"{medal} {i}. {player:20} - {points:+5d} points")
+        for i, idx in enumerate(order, 1):
+            medal = _MEDALS[i] if i < len(_MEDALS) else "  "
+            GameDisplay._print(f"{medal} {i}. {player_names[idx]:20} - {cumulative_points[idx]:+5d} points")
         
-        print(GameDisplay.DIVIDER)
+        GameDisplay._print(GameDisplay.DIVIDER)
+        GameDisplay.flush()
     
     @staticmethod
     def get_round_description(round_type: str) -> str:
@@ -297,15 +374,7 @@ class GameDisplay:
         str
             Description of round objective.
         """
-        descriptions = {
-            "vazas": "Avoid winning vazas",
-            "copas": "Avoid collecting Hearts (♥)",
-            "homens": "Avoid collecting Jacks and Kings",
-            "mulheres": "Avoid collecting Queens",
-            "king": "Avoid the King of Hearts (K♥)",
-            "last": "Avoid winning the last vaza"
-        }
-        return descriptions.get(round_type, "")
+        return _ROUND_DESCRIPTIONS.get(round_type, "")
     
     @staticmethod
     def get_round_detail(round_type: str, current_round: Round, player_idx: int) -> str:
@@ -326,24 +395,8 @@ class GameDisplay:
         str
             Description of what the player collected.
         """
-        if round_type == "vazas":
-            return f"{current_round.vazas_won[player_idx]} vazas"
-        elif round_type == "copas":
-            hearts = current_round.count_suit(player_idx, Suit.HEARTS)
-            return f"{hearts} hearts"
-        elif round_type == "homens":
-            men = sum(1 for c in current_round.cards_won[player_idx] 
-                      if c.rank == Rank.JACK or c.rank == Rank.KING)
-            return f"{men} men (J+K)"
-        elif round_type == "mulheres":
-            queens = sum(1 for c in current_round.cards_won[player_idx]
-                         if c.rank == Rank.QUEEN)
-            return f"{queens} queens"
-        elif round_type == "king":
-            has_king = any(c.rank == Rank.KING and c.suit == Suit.HEARTS 
-                          for c in current_round.cards_won[player_idx])
-            return "King of Hearts!" if has_king else "Safe"
-        elif round_type == "last":
-            won_last = current_round.vazas_won[player_idx] > 0
-            return "Won last vaza!" if won_last else "Safe"
-        return ""
+        handler = _DETAIL_HANDLERS.get(round_type)
+        if handler is None:
+            return ""
+        
+        return handler(current_round, player_idx)
@@ -1,7 +1,24 @@
 from point_manager import PointManager
 
+# Bound once at import so the totals don't look them up on the class per call
+_get_points_vazas = PointManager.get_points_vazas
+_get_points_copas = PointManager.get_points_copas
+_get_points_homens = PointManager.get_points_homens
+_get_points_mulheres = PointManager.get_points_mulheres
+_get_points_king = PointManager.get_points_king
+_get_points_last = PointManager.get_points_last
+_get_points_nulos = PointManager.get_points_nulos
+
 class GamePlayer():
 
+    # 'hand' is only set by test_mc_vs_heuristic, which deals hands onto players
+    __slots__ = (
+        'id', 'name', 'is_ai',
+        'vazas', 'copas', 'homens', 'mulheres', 'king', 'last',
+        'festa1', 'festa2', 'festa3', 'festa4', 'nulos_check',
+        'hand',
+    )
+
     def __init__(self, id: int, name: str, is_ai: bool = False) -> None:
         self.id = id
         self.name = name
@@ -23,18 +40,21 @@ class GamePlayer():
         self.nulos_check = {f'Festa{i}': 1 for i in range(1,5)} # Default all to Nulos
 
     def get_total1(self) -> int:
-        points_vazas = PointManager.get_points_vazas(self.vazas)
-        points_copas = PointManager.get_points_copas(self.copas)
-        points_homens = PointManager.get_points_homens(self.homens) 
-        points_mulheres = PointManager.get_points_mulheres(self.mulheres) 
-        points_king = PointManager.get_points_king(self.king) 
-        points_last = PointManager.get_points_last(self.last)
+        points_vazas = _get_points_vazas(self.vazas)
+        points_copas = _get_points_copas(self.copas)
+        points_homens = _get_points_homens(self.homens) 
+        points_mulheres = _get_points_mulheres(self.mulheres) 
+        points_king = _get_points_king(self.king) 
+        points_last = _get_points_last(self.last)
         return points_vazas + points_copas + points_homens + points_mulheres + points_king + points_last
     
     def get_total(self) -> int:
         """Total including festa scores, optionally affected by Nulos/Positive."""
-        festa_total = 0
-        for i in range(1,5):
-            festa_attr = getattr(self, f'festa{i}', 0)
-            festa_total += PointManager.get_points_nulos(festa_attr, self.nulos_check.get(f'Festa{i}', 1))
+        nulos_check = self.nulos_check
+        festa_total = (
+            _get_points_nulos(self.festa1, nulos_check.get('Festa1', 1))
+            + _get_points_nulos(self.festa2, nulos_check.get('Festa2', 1))
+            + _get_points_nulos(self.festa3, nulos_check.get('Festa3', 1))
+            + _get_points_nulos(self.festa4, nulos_check.get('Festa4', 1))
+        )
         return self.get_total1() + festa_total
\ No newline at end of file
@@ -1,6 +1,36 @@
-from deck import Card, Deck, Suit, Rank
+from deck import (
+    Card, Deck, Suit, Rank, IS_HEART, IS_MAN, IS_QUEEN, IS_KING_OF_HEARTS,
+)
 from game_player import GamePlayer
-from point_manager import PointManager
+from point_manager import POINTS_TABLE
+
+# Per-card penalty table for each round scored by counting won cards
+_PENALTY_TABLES: dict[str, tuple[bool, ...]] = {
+    "copas": IS_HEART,
+    "homens": IS_MAN,
+    "mulheres": IS_QUEEN,
+    "king": IS_KING_OF_HEARTS,
+}
+
+# Penalty cards in the deck and early-end message for each round that can
+# stop once they have all been played
+_EARLY_END: dict[str, tuple[int, str]] = {
+    "copas": (13, "\n✓ All hearts have been played. Ending round early.\n"),
+    "homens": (8, "\n✓ All jacks and kings have been played. Ending round early.\n"),
+    "mulheres": (4, "\n✓ All queens have been played. Ending round early.\n"),
+    "king": (1, "\n✓ King of Hearts has been played. Ending round early.\n"),
+}
+
+# Rounds played with a trump suit chosen by the player
+_FESTA_ROUNDS: frozenset[str] = frozenset(("festa1", "festa2", "festa3", "festa4"))
+
+# Lowest packed winner key of a trump or main-suit play (see get_vaza_winner)
+_MAIN_KEY_BIT = 1 << 7
+
+# Clockwise play order for each starting player
+_PLAY_ORDERS: tuple[tuple[int, ...], ...] = tuple(
+    tuple((starter + i) % 4 for i in range(4)) for starter in range(4)
+)
 
 
 class Vaza:
@@ -18,12 +48,28 @@ class Vaza:
         Index (0-3) of the player who starts this vaza.
     card_plays : list[tuple[int, Card]]
         List of (player_index, card) tuples representing plays in order.
+    cards_played : list[Card]
+        Cards in play order, kept in step with card_plays.
+    play_order : list[int]
+        Player indices in the order they played cards, kept in step with
+        card_plays.
     main_suit : Suit or None
         The suit of the first card played (determines which suit must be followed).
+    main_sv : int
+        Integer value of main_suit (-1 before any play), compared against
+        Card.sv in hot loops instead of Suit members.
+    highest_main_rank : int
+        Highest rank value of the main suit played so far (0 before any play).
     winner : int or None
         Index (0-3) of the player who won this vaza.
     """
     
+    # Thirteen instances per round, plus one per vaza of every simulation
+    __slots__ = (
+        "vaza_number", "starter", "card_plays", "cards_played", "play_order",
+        "main_suit", "main_sv", "highest_main_rank", "winner",
+    )
+    
     def __init__(self, vaza_number: int, starter: int) -> None:
         """
         Initialize a new vaza.
@@ -38,32 +84,38 @@ class Vaza:
         self.vaza_number: int = vaza_number
         self.starter: int = starter
         self.card_plays: list[tuple[int, Card]] = []
+        self.cards_played: list[Card] = []
+        self.play_order: list[int] = []
         self.main_suit: Suit = None
+        self.main_sv: int = -1
+        self.highest_main_rank: int = 0
         self.winner: int = None
     
-    @property
-    def cards_played(self) -> list[Card]:
+    def add_card(self, player_idx: int, card: Card) -> None:
         """
-        Get list of cards played in this vaza (derived from card_plays).
+        Record a card played in this vaza.
         
-        Returns
-        -------
-        list[Card]
-            Cards in play order.
-        """
-        return [card for _, card in self.card_plays]
-    
-    @property
-    def play_order(self) -> list[int]:
-        """
-        Get list of player indices in play order (derived from card_plays).
+        Parameters
+        ----------
+        player_idx : int
+            Index (0-3) of the player playing the card.
+        card : Card
+            The card being played.
         
-        Returns
-        -------
-        list[int]
-            Player indices in the order they played cards.
-        """
-        return [player_idx for player_idx, _ in self.card_plays]
+        Notes
+        -----
+        Sets the main suit from the first card and keeps highest_main_rank
+        up to date, so strategies don't need to rescan the played cards.
+        """
+        self.card_plays.append((player_idx, card))
+        self.cards_played.append(card)
+        self.play_order.append(player_idx)
+        
+        if self.main_suit is None:
+            self.main_suit = card.suit
+            self.main_sv = card.sv
+        if card.sv == self.main_sv and card.rv > self.highest_main_rank:
+            self.highest_main_rank = card.rv
 
 
 class Round:
@@ -92,9 +144,13 @@ class Round:
         The vaza currently being played (None if no active vaza).
     trump_suit : Suit or None
         Trump suit for festa rounds (None for non-festa rounds).
+    penalty_won : list[int]
+        Number of the round's penalty cards (hearts, men, queens or the King
+        of Hearts) won by each player, updated as each vaza is completed.
     """
     
-    def __init__(self, round_type: str = "vazas", players: list[GamePlayer] = None) -> None:
+    def __init__(self, round_type: str = "vazas", players: list[GamePlayer] = None,
+                 trump_suit: Suit | None = None) -> None:
         """
         Initialize a new round of the card game.
         
@@ -106,11 +162,14 @@ class Round:
             "festa3", "festa4" (default is "vazas").
         players : list[GamePlayer], optional
             List of 4 GamePlayer objects (default is None).
+        trump_suit : Suit, optional
+            Trump suit for festa rounds, if already known (default is None).
         
         Notes
         -----
-        For festa rounds ("festa1", "festa2", "festa3", "festa4"), the user
-        will be prompted to select a trump suit.
+        For festa rounds ("festa1", "festa2", "festa3", "festa4") without a
+        trump_suit, the user will be prompted to select one. Passing it lets
+        simulations create festa rounds without blocking on input.
         """
         self.round_type: str = round_type
         self.players: list[GamePlayer] = players if players else []
@@ -119,18 +178,32 @@ class Round:
         self.starting_player: int = 0
         self.vazas_history: list[Vaza] = []
         self.current_vaza: Vaza = None
-        self.trump_suit: Suit = None
+        self.trump_suit: Suit = trump_suit
+        self.penalty_won: list[int] = [0, 0, 0, 0]
+        self._penalty_table: tuple[bool, ...] | None = _PENALTY_TABLES.get(round_type)
         
-        if round_type in ["festa1", "festa2", "festa3", "festa4"]:
+        if round_type in _FESTA_ROUNDS and trump_suit is None:
             self.trump_suit = self._select_trump_suit(round_type)
     
-    def start(self) -> None:
+    def start(self, starting_player: int | None = None) -> None:
         """
         Start the round by selecting starting player.
         
-        Prompts user to select which player will start the round,
-        then waits for cards to be dealt in real life.
+        Parameters
+        ----------
+        starting_player : int, optional
+            Index (0-3) of the player who starts the round (default is None).
+        
+        Notes
+        -----
+        Without starting_player, prompts the user to select which player will
+        start the round, then waits for cards to be dealt in real life. With
+        it, no input is read, so headless games and simulations don't block.
         """
+        if starting_player is not None:
+            self.starting_player = starting_player
+            return
+        
         self.starting_player = self._select_starting_player()
         input("Press Enter when cards are dealt in real life...")
     
@@ -250,11 +323,7 @@ class Round:
         if self.current_vaza is None:
             raise ValueError("No active vaza to play card in")
         
-        self.current_vaza.card_plays.append((player_idx, card))
-        
-        # Set main suit from first card
-        if self.current_vaza.main_suit is None:
-            self.current_vaza.main_suit = card.suit
+        self.current_vaza.add_card(player_idx, card)
     
     def get_vaza_winner(self) -> int:
         """
@@ -283,73 +352,68 @@ class Round:
         if self.current_vaza is None:
             raise ValueError("No active vaza to determine winner")
         
-        # Check for trump suit cards first (if trump suit is defined)
-        if self.trump_suit is not None:
-            trump_cards = [
-                (i, card) for i, card in enumerate(self.current_vaza.cards_played)
-                if card.suit == self.trump_suit
-            ]
-            
-            if trump_cards:
-                # Trump cards present - highest trump wins
-                winner_position, _ = max(trump_cards, key=lambda x: x[1].rank.value)
-                winner_player = self.current_vaza.play_order[winner_position]
-                
-                # Update state
-                self.current_vaza.winner = winner_player
-                self.vazas_won[winner_player] += 1
-                self.cards_won[winner_player].extend(self.current_vaza.cards_played)
-                self.starting_player = winner_player
-                self.vazas_history.append(self.current_vaza)
-                self.current_vaza = None
-                
-                return winner_player
-        
-        # No trump cards or no trump suit - highest card of main suit wins
-        main_suit_cards = [
-            (i, card) for i, card in enumerate(self.current_vaza.cards_played)
-            if card.suit == self.current_vaza.main_suit
-        ]
-        
-        if not main_suit_cards:
+        # Rank each play with one packed key: trumps beat main-suit cards,
+        # which beat off-suit discards, then higher rank wins
+        vaza = self.current_vaza
+        trump_sv = self.trump_suit.value if self.trump_suit is not None else -1
+        main_sv = vaza.main_sv
+        best_key = winner_position = -1
+        for position, card in enumerate(vaza.cards_played):
+            sv = card.sv
+            key = ((sv == trump_sv) << 8) | ((sv == main_sv) << 7) | card.rv
+            if key > best_key:
+                best_key, winner_position = key, position
+        
+        if best_key < _MAIN_KEY_BIT:
             raise ValueError("No cards of main suit found in vaza - should not happen")
         
-        # Get the highest card of the main suit
-        winner_position, _ = max(main_suit_cards, key=lambda x: x[1].rank.value)
-        winner_player = self.current_vaza.play_order[winner_position]
+        winner_player = vaza.play_order[winner_position]
+        self._complete_vaza(winner_player)
+        return winner_player
+    
+    def _complete_vaza(self, winner_player: int) -> None:
+        """
+        Record the current vaza as won by winner_player and close it.
         
-        # Update state
+        Parameters
+        ----------
+        winner_player : int
+            Index (0-3) of the player who won the current vaza.
+        """
+        cards_played = self.current_vaza.cards_played
         self.current_vaza.winner = winner_player
         self.vazas_won[winner_player] += 1
-        self.cards_won[winner_player].extend(self.current_vaza.cards_played)
+        self.cards_won[winner_player].extend(cards_played)
+        if self._penalty_table is not None:
+            table = self._penalty_table
+            self.penalty_won[winner_player] += sum(table[c.idx] for c in cards_played)
         self.starting_player = winner_player
         self.vazas_history.append(self.current_vaza)
         self.current_vaza = None
-        
-        return winner_player
     
-    def get_play_order(self) -> list[int]:
+    def get_play_order(self) -> tuple[int, ...]:
         """
         Get the order in which players play this vaza (clockwise from starter).
         
         Returns
         -------
-        list[int]
-            List of player indices in play order [starter, starter+1, starter+2, starter+3] (mod 4).
+        tuple[int, ...]
+            Player indices in play order [starter, starter+1, starter+2, starter+3] (mod 4),
+            from a precomputed table.
         """
-        return [(self.starting_player + i) % 4 for i in range(4)]
+        return _PLAY_ORDERS[self.starting_player]
     
-    def get_next_vaza_info(self) -> dict[str, int | list[int]]:
+    def get_next_vaza_info(self) -> dict[str, int | tuple[int, ...]]:
         """
         Get info about the next vaza to be played.
         
         Returns
         -------
-        dict[str, int | list[int]]
+        dict[str, int | tuple[int, ...]]
             Dictionary containing:
             - 'vaza_number': Sequential number of next vaza (1-13)
             - 'starter': Index of player who starts next vaza
-            - 'play_order': List of player indices in play order
+            - 'play_order': Tuple of player indices in play order
         """
         return {
             'vaza_number': len(self.vazas_history) + 1,
@@ -357,15 +421,10 @@ class Round:
             'play_order': self.get_play_order()
         }
     
-    def can_end_early(self, cards_played_round: list[Card]) -> tuple[bool, str]:
+    def can_end_early(self) -> tuple[bool, str]:
         """
         Check if the current round can end early because all relevant penalty cards have been played.
         
-        Parameters
-        ----------
-        cards_played_round : list[Card]
-            List of all cards played in the round so far.
-        
         Returns
         -------
         tuple[bool, str]
@@ -380,30 +439,24 @@ class Round:
         - "homens": All 8 men (4 jacks + 4 kings) played
         - "mulheres": All 4 queens played
         - "king": King of Hearts played
-        """
-        if self.round_type == "copas":
-            hearts_played = sum(1 for c in cards_played_round if c.suit == Suit.HEARTS)
-            if hearts_played == 13:
-                return True, "\n✓ All hearts have been played. Ending round early.\n"
         
-        elif self.round_type == "homens":
-            men_played = sum(1 for c in cards_played_round if c.rank in [Rank.JACK, Rank.KING])
-            if men_played == 8:
-                return True, "\n✓ All jacks and kings have been played. Ending round early.\n"
-        
-        elif self.round_type == "mulheres":
-            queens_played = sum(1 for c in cards_played_round if c.rank == Rank.QUEEN)
-            if queens_played == 4:
-                return True, "\n✓ All queens have been played. Ending round early.\n"
+        Penalty cards in completed vazas are already tallied in penalty_won,
+        so only the cards of an unfinished vaza need to be looked at. A card
+        entered twice through an override counts twice, so the tally may
+        overshoot the number of penalty cards in the deck.
+        """
+        early_end = _EARLY_END.get(self.round_type)
+        if early_end is None:
+            return False, ""
         
-        elif self.round_type == "king":
-            king_of_hearts_played = any(
-                c.suit == Suit.HEARTS and c.rank == Rank.KING 
-                for c in cards_played_round
-            )
-            if king_of_hearts_played:
-                return True, "\n✓ King of Hearts has been played. Ending round early.\n"
+        total, message = early_end
+        played = sum(self.penalty_won)
+        if self.current_vaza is not None:
+            table = self._penalty_table
+            played += sum(table[c.idx] for c in self.current_vaza.cards_played)
         
+        if played >= total:
+            return True, message
         return False, ""
     
     def get_valid_plays(self, hand: list[Card]) -> list[Card]:
@@ -436,45 +489,18 @@ class Round:
         if self.current_vaza is None or self.current_vaza.main_suit is None:
             return hand.copy()
         
-        # Check what cards the player has
-        has_main_suit = any(c.suit == self.current_vaza.main_suit for c in hand)
-        
-        valid = []
-        
-        for card in hand:
-            if self.round_type == "copas":
-                if has_main_suit and card.suit != self.current_vaza.main_suit:
-                    continue
-                has_hearts = any(c.suit == Suit.HEARTS for c in hand)
-                if not has_main_suit and has_hearts and card.suit != Suit.HEARTS:
-                    continue
-                valid.append(card)
-            elif self.round_type == "homens":
-                if has_main_suit and card.suit != self.current_vaza.main_suit:
-                    continue
-                has_men = any(c.rank in [Rank.JACK, Rank.KING] for c in hand)
-                if not has_main_suit and has_men and card.rank not in [Rank.JACK, Rank.KING]:
-                    continue
-                valid.append(card)
-            elif self.round_type == "mulheres":
-                if has_main_suit and card.suit != self.current_vaza.main_suit:
-                    continue
-                has_women = any(c.rank == Rank.QUEEN for c in hand)
-                if not has_main_suit and has_women and card.rank != Rank.QUEEN:
-                    continue
-                valid.append(card)
-            elif self.round_type == "king":
-                if has_main_suit and card.suit != self.current_vaza.main_suit:
-                    continue
-                has_king_of_hearts = any(c.suit == Suit.HEARTS and c.rank == Rank.KING for c in hand)
-                if not has_main_suit and has_king_of_hearts and not (card.suit == Suit.HEARTS and card.rank == Rank.KING):
-                    continue
-                valid.append(card)
-            else:
-                # Default: follow suit
-                if has_main_suit and card.suit != self.current_vaza.main_suit:
-                    continue
-                valid.append(card)
+        # Common case: the player can follow the main suit, whatever the round.
+        # One filtering pass both answers "has main suit?" and builds the result.
+        main_sv = self.current_vaza.main_sv
+        valid = [card for card in hand if card.sv == main_sv]
+        if valid:
+            return valid
+        
+        if self._penalty_table is not None:
+            # Can't follow: must discard the round's penalty cards (hearts in
+            # copas, jacks/kings in homens, queens in mulheres, KH in king)
+            table = self._penalty_table
+            valid = [card for card in hand if table[card.idx]]
         
         return valid if valid else hand.copy()
     
@@ -538,56 +564,26 @@ class Round:
         NotImplementedError
             If round_type is not recognized.
         """
+        # Unknown round types have no table and fall through to the error below
+        points = POINTS_TABLE.get(self.round_type, ())
+        
         if self.round_type == "vazas":
-            return [
-                PointManager.get_points(self.round_type, self.vazas_won[i])
-                for i in range(4)
-            ]
-        elif self.round_type == "copas":
-            hearts_won = [self.count_suit(i, Suit.HEARTS) for i in range(4)]
-            return [
-                PointManager.get_points(self.round_type, hearts_won[i])
-                for i in range(4)
-            ]
-        elif self.round_type == "homens":
-            men_won = [
-                self.count_rank(i, Rank.JACK) + self.count_rank(i, Rank.KING)
-                for i in range(4)
-            ]
-            return [
-                PointManager.get_points(self.round_type, men_won[i])
-                for i in range(4)
-            ]
-        elif self.round_type == "mulheres":
-            women_won = [self.count_rank(i, Rank.QUEEN) for i in range(4)]
-            return [
-                PointManager.get_points(self.round_type, women_won[i])
-                for i in range(4)
-            ]
+            return [points[n] for n in self.vazas_won]
         elif self.round_type == "king":
-            king_points = [0, 0, 0, 0]
-            for player_idx in range(4):
-                for card in self.cards_won[player_idx]:
-                    if card.rank == Rank.KING and card.suit == Suit.HEARTS:
-                        king_points[player_idx] = PointManager.get_points(self.round_type, 1)
-                        break
-            return king_points
+            # Flat penalty for taking the King of Hearts, even if an override
+            # let it be played (and counted) more than once
+            return [points[1] if n else 0 for n in self.penalty_won]
+        elif self.round_type in _PENALTY_TABLES:
+            # copas/homens/mulheres: per card won
+            return [points[n] for n in self.penalty_won]
         elif self.round_type == "last":
             last_two_vazas_won = [0, 0, 0, 0]
             
-            # Check the last 2 vazas
-            history = self.vazas_history
-            if len(history) >= 12:
-                winner_12 = history[11].winner
-                last_two_vazas_won[winner_12] += 1
-            
-            if len(history) >= 13:
-                winner_13 = history[12].winner
-                last_two_vazas_won[winner_13] += 1
+            # Check the last 2 vazas (12th and 13th); the slice is shorter if
+            # the round has not reached them yet
+            for vaza in self.vazas_history[11:13]:
+                last_two_vazas_won[vaza.winner] += 1
             
-            return [
-                PointManager.get_points(self.round_type, last_two_vazas_won[i])
-                for i in range(4)
-            ]
+            return [points[n] for n in last_two_vazas_won]
         else:
             raise NotImplementedError(f"Round type '{self.round_type}' not implemented yet")
@@ -13,7 +13,7 @@ from game_player import GamePlayer
 from game_display import GameDisplay
 
 # Define the order of rounds in a King game
-ROUND_ORDER = ["vazas", "copas", "homens", "mulheres", "king", "last"]
+ROUND_ORDER = ("vazas", "copas", "homens", "mulheres", "king", "last")
 
 
 def setup_players() -> tuple[list[str], list[bool]]:
@@ -83,6 +83,8 @@ def start_game():
                                         num_simulations=30)
 
         cards_played_round: list[Card] = []
+        # Mirrors cards_played_round as a 52-bit mask for O(1) "already played" checks
+        played_mask = 0
         
         # Play all 13 vazas in this round
         for vaza_num in range(13):
@@ -120,6 +122,7 @@ def start_game():
                     
                     current_round.play_card(player_idx, card)
                     cards_played_round.append(card)
+                    played_mask |= card.bit
                     GameDisplay.show_ai_play(players[player_idx], card)
                 
                 else:
@@ -142,7 +145,7 @@ def start_game():
                             GameDisplay.show_invalid_card_format()
                             continue
                         
-                        if card in cards_played_round:
+                        if played_mask & card.bit:
                             GameDisplay.show_card_already_played(card)
                             override = input(f"      Override and play anyway? (y/n): ").strip().lower()
                             if override != 'y':
@@ -150,6 +153,7 @@ def start_game():
 
                         current_round.play_card(player_idx, card)
                         cards_played_round.append(card)
+                        played_mask |= card.bit
                         GameDisplay.show_card_played(players[player_idx], card)
                         break
             
@@ -158,7 +162,7 @@ def start_game():
             GameDisplay.show_vaza_winner(players[winner], current_round.vazas_won, players)
             
             # Check if round can end early
-            can_end, message = current_round.can_end_early(cards_played_round)
+            can_end, message = current_round.can_end_early()
             if can_end:
                 print(message)
                 break  # Exit the vaza loop
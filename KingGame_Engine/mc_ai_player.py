@@ -1,6 +1,8 @@
 import random
 from copy import deepcopy
-from deck import Card, Suit, Rank, Deck
+from deck import (
+    Card, Suit, Rank, Deck, CARD_SORT_KEY, IS_HEART, IS_MAN, IS_QUEEN, KING_OF_HEARTS,
+)
 from game_simulator import Vaza, Round
 from ai_player import AIPlayer
 from point_manager import PointManager
@@ -82,6 +84,7 @@ class MonteCarloAI:
             
             # Convert strings to Card objects
             cards: list[Card] = []
+            seen: set[Card] = set()
             invalid = False
             for card_str in card_strings:
                 card = Card.from_string(card_str)
@@ -89,17 +92,18 @@ class MonteCarloAI:
                     print(f"  ❌ Invalid card format: '{card_str}'\n")
                     invalid = True
                     break
-                if card in cards:
+                if card in seen:
                     print(f"  ❌ Duplicate card: {card}\n")
                     invalid = True
                     break
+                seen.add(card)
                 cards.append(card)
             
             if invalid:
                 continue
             
             # Sort and display
-            sorted_cards = sorted(cards, key=lambda c: (c.suit.value, c.rank.value))
+            sorted_cards = sorted(cards, key=CARD_SORT_KEY)
             cards_str = ", ".join([str(card) for card in sorted_cards])
             print(f"  ✓ Hand set for {player_name}: {cards_str}\n")
             return cards
@@ -162,56 +166,58 @@ class MonteCarloAI:
         
         # Remove played cards from ALL players' hand estimates
         for card in current_vaza.cards_played:
+            played_idx = card.idx
             for player_idx in range(4):
                 if player_idx != self.my_player_index:
                     # Remove the played card from this player's possible cards
                     self.player_hand_estimates[player_idx] = [
                         c for c in self.player_hand_estimates[player_idx]
-                        if not (c.suit == card.suit and c.rank == card.rank)
+                        if c.idx != played_idx
                     ]
         
         # Check for players who didn't follow suit (revealing they're out of that suit)
+        main_sv = current_vaza.main_sv
         for player_idx, card in current_vaza.card_plays:
             # Skip the AI player (we know our own hand)
             if player_idx == self.my_player_index:
                 continue
             
             # If this player didn't follow the main suit, they must be out of it
-            if card.suit != current_vaza.main_suit:
+            if card.sv != main_sv:
                 # Remove all cards of the main suit from this player's estimates
                 self.player_hand_estimates[player_idx] = [
                     c for c in self.player_hand_estimates[player_idx]
-                    if c.suit != current_vaza.main_suit
+                    if c.sv != main_sv
                 ]
                 
                 # Handle special penalty round rules
                 if self.round_type == "copas":
                     # In copas: if they didn't play hearts, they're also out of hearts
-                    if card.suit != Suit.HEARTS:
+                    if not IS_HEART[card.idx]:
                         self.player_hand_estimates[player_idx] = [
                             c for c in self.player_hand_estimates[player_idx]
-                            if c.suit != Suit.HEARTS
+                            if not IS_HEART[c.idx]
                         ]
                 elif self.round_type == "homens":
                     # In homens: if they didn't play J/K, they have no J/K
-                    if card.rank not in [Rank.JACK, Rank.KING]:
+                    if not IS_MAN[card.idx]:
                         self.player_hand_estimates[player_idx] = [
                             c for c in self.player_hand_estimates[player_idx]
-                            if c.rank not in [Rank.JACK, Rank.KING]
+                            if not IS_MAN[c.idx]
                         ]
                 elif self.round_type == "mulheres":
                     # In mulheres: if they didn't play a Q, they have no queens
-                    if card.rank != Rank.QUEEN:
+                    if not IS_QUEEN[card.idx]:
                         self.player_hand_estimates[player_idx] = [
                             c for c in self.player_hand_estimates[player_idx]
-                            if c.rank != Rank.QUEEN
+                            if not IS_QUEEN[c.idx]
                         ]
                 elif self.round_type == "king":
                     # In king: if they didn't play KH, they don't have it
-                    if not (card.suit == Suit.HEARTS and card.rank == Rank.KING):
+                    if card != KING_OF_HEARTS:
                         self.player_hand_estimates[player_idx] = [
                             c for c in self.player_hand_estimates[player_idx]
-                            if not (c.suit == Suit.HEARTS and c.rank == Rank.KING)
+                            if c != KING_OF_HEARTS
                         ]
     
     def choose_card(self, valid_plays: list[Card], current_vaza: Vaza) -> Card:
@@ -257,7 +263,7 @@ class MonteCarloAI:
             card_scores[card] = avg_score
         
         # Choose card with best (highest/least negative) average score
-        best_card = max(card_scores.keys(), key=lambda c: card_scores[c])
+        best_card = max(card_scores, key=card_scores.__getitem__)
         return best_card
     
     def _simulate_card_play(self, card: Card, current_vaza: Vaza) -> float:
@@ -375,15 +381,18 @@ class MonteCarloAI:
             A round object ready for simulation.
         """
         # Create a fresh round
-        sim_round = Round(self.round_type, self.current_round.players)
-        sim_round.starting_player = self.current_round.starting_player
+        sim_round = Round(self.round_type, self.current_round.players,
+                          trump_suit=self.current_round.trump_suit)
+        sim_round.start(self.current_round.starting_player)
         sim_round.vazas_history = [vaza for vaza in self.current_round.vazas_history]
         
         # Copy current vaza state
         if current_vaza and current_vaza.cards_played:
-            sim_round.current_vaza = Vaza(current_vaza.vaza_number, current_vaza.starter)
-            sim_round.current_vaza.card_plays = current_vaza.card_plays.copy()
-            sim_round.current_vaza.main_suit = current_vaza.main_suit
+            # Replay the plays so add_card rebuilds every derived field
+            sim_vaza = Vaza(current_vaza.vaza_number, current_vaza.starter)
+            for player_idx, card in current_vaza.card_plays:
+                sim_vaza.add_card(player_idx, card)
+            sim_round.current_vaza = sim_vaza
             
             # Add the AI's card to the simulation
             sim_round.play_card(self.my_player_index, card_to_play)
@@ -50,4 +50,12 @@ class PointManager:
         """Calculate festa points based on nulos/positivo mode."""
         if nulos:
             return cls.NULOS_BASE_POINTS + cls.get_points('nulos', n_vazas)
-        return cls.get_points('positivo', n_vazas)
\ No newline at end of file
+        return cls.get_points('positivo', n_vazas)
+
+
+# Points for every (round type, count) pair. A round has at most 52 plays,
+# so no count can exceed 52, even when an override enters a card twice.
+POINTS_TABLE: dict[str, tuple[int, ...]] = {
+    round_type: tuple(PointManager.get_points(round_type, n) for n in range(53))
+    for round_type in PointManager.POINTS_MAP
+}
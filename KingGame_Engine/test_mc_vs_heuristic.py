@@ -43,7 +43,7 @@ def run_round(round_type: str, players: list[GamePlayer], deck: Deck, debug: boo
     
     # Create round
     round_obj = Round(round_type, players)
-    round_obj.starting_player = 0
+    round_obj.start(starting_player=0)
     
     # Create Monte Carlo AI instance once per round
     mc_ai_instance = None
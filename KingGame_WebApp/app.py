@@ -238,14 +238,15 @@ def finish_game():
     totals_final = {gp.id: gp.get_total() for gp in game_players}
 
     # Compute ranks (highest rank for ties)
-    sorted_players = sorted(game_players, key=lambda p: p.get_total(), reverse=True)
+    # Reuse the totals computed above; the scores don't change past this point
+    sorted_players = sorted(game_players, key=lambda p: totals_final[p.id], reverse=True)
     ranks_fields = ['firsts', 'seconds', 'thirds', 'fourths']
     position = 0
     player_ranks = {}
 
     while position < len(sorted_players):
-        current_total = sorted_players[position].get_total()
-        tied_players = [p for p in sorted_players[position:] if p.get_total() == current_total]
+        current_total = totals_final[sorted_players[position].id]
+        tied_players = [p for p in sorted_players[position:] if totals_final[p.id] == current_total]
         rank_index = position
         for p in tied_players:
             if rank_index < len(ranks_fields):